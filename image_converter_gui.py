@@ -1,6 +1,12 @@
+import gc
+import io
 import os
+import queue
+import shutil
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from PyQt6.QtWidgets import (
     QApplication,
@@ -10,6 +16,7 @@ from PyQt6.QtWidgets import (
     QHBoxLayout,
     QPushButton,
     QLabel,
+    QCheckBox,
     QComboBox,
     QFileDialog,
     QProgressBar,
@@ -17,9 +24,264 @@ from PyQt6.QtWidgets import (
     QSlider,
     QLineEdit,
 )
-from PyQt6.QtCore import Qt, QObject, QThread, pyqtSignal
+from PyQt6.QtCore import Qt, QObject, QThread, QTimer, pyqtSignal
 from PyQt6.QtGui import QIcon
-from PIL import Image, UnidentifiedImageError
+# PIL is imported lazily inside the conversion helpers: loading its C
+# extensions at module import time would delay first paint of the GUI, and
+# nothing on the startup path needs it.
+
+# Resize factor for each size option; anything unlisted means "Original" (1.0).
+_RESIZE_FACTORS = {"Small": 0.5, "Medium": 0.75, "Large": 1.5}
+
+# File extensions the converter accepts, matched case-insensitively.
+VALID_EXTS = frozenset({".png", ".jpg", ".jpeg", ".webp", ".bmp", ".gif", ".tiff"})
+
+# Pre-encode target mode per source mode, chosen so the WebP encoder never
+# has to convert internally during save: no alpha channel unless the source
+# has one. P and 1-bit are handled separately, before any resampling: P's
+# target depends on the palette's transparency entry, and "1" must be
+# promoted up front because reduce()/resize don't handle it.
+_TARGET_MODES = {"L": "RGB", "LA": "RGBA", "CMYK": "RGB"}
+
+# Pillow format name per extension: passing it to Image.open skips probing
+# every registered plugin against the file header.
+_EXT_TO_FORMAT = {
+    ".jpg": "JPEG",
+    ".jpeg": "JPEG",
+    ".png": "PNG",
+    ".webp": "WEBP",
+    ".bmp": "BMP",
+    ".gif": "GIF",
+    ".tiff": "TIFF",
+}
+
+
+def _resample_filter(quality_value):
+    """
+    Pick a resample filter matched to the requested output quality: LANCZOS
+    detail is wasted on low-quality lossy output, and the cheaper kernels
+    need far fewer multiply-accumulates per pixel.
+    """
+    from PIL import Image
+
+    try:
+        resampling = Image.Resampling
+    except AttributeError:
+        resampling = Image
+    if quality_value >= 85:
+        return resampling.LANCZOS
+    if quality_value >= 60:
+        return resampling.BICUBIC
+    return resampling.BILINEAR
+
+
+# Result of the one-time probe for the optional webp bindings; False means
+# "not probed yet", since None is the probed-and-missing answer.
+_webp_bindings = False
+
+
+def _webp_module():
+    """
+    Returns the optional libwebp bindings module, or None when unavailable.
+    Probed once and cached: a failed import is not recorded in sys.modules,
+    so retrying per image would pay a sys.path scan on every encode.
+    """
+    global _webp_bindings
+    if _webp_bindings is False:
+        try:
+            import webp as bindings
+        except ImportError:
+            bindings = None
+        _webp_bindings = bindings
+    return _webp_bindings
+
+
+# One reusable encode buffer per pool thread: the underlying bytearray grows
+# to the largest output seen and stays allocated, instead of a fresh
+# BytesIO malloc/free cycle per image. Safe because the bytes are copied
+# out via getvalue() before the buffer is reused.
+_encode_buffers = threading.local()
+
+
+def _encode_webp(img, quality_value, lossless_mode):
+    """
+    Encode img to WebP bytes, preferring the native libwebp bindings when
+    the optional webp package is installed and falling back to Pillow's
+    plugin otherwise (or if the bindings reject the image).
+    """
+    webp = _webp_module()
+    if webp is not None and img.mode in ("RGB", "RGBA"):
+        try:
+            pic = webp.WebPPicture.from_pil(img)
+            try:
+                config = webp.WebPConfig.new(
+                    quality=quality_value,
+                    lossless=lossless_mode,
+                    method=6 if lossless_mode else 2,
+                )
+            except TypeError:
+                # Older bindings without the method parameter.
+                config = webp.WebPConfig.new(
+                    quality=quality_value, lossless=lossless_mode
+                )
+            return pic.encode(config).buffer()
+        except Exception:
+            pass  # fall back to Pillow's encoder below
+    # A batch format converter has no use for source metadata: dropping
+    # ICC/EXIF/XMP here keeps Pillow from copying them into output chunks
+    # (passing icc_profile=None to save() would not, since the plugin falls
+    # back to img.info), and exact=False lets libwebp discard RGB values
+    # under fully transparent pixels for better compression.
+    for meta_key in ("icc_profile", "exif", "xmp"):
+        img.info.pop(meta_key, None)
+
+    try:
+        buf = _encode_buffers.buf
+        buf.seek(0)
+        buf.truncate()
+    except AttributeError:
+        buf = _encode_buffers.buf = io.BytesIO()
+    # method trades encode speed for file size (0=fastest, 6=slowest). Lossy
+    # batch re-encodes gain little from the deeper block-partition searches,
+    # so take the fast path; lossless means the user asked for the best
+    # output, so spend the encode time there.
+    img.save(
+        buf,
+        "WEBP",
+        quality=quality_value,
+        lossless=lossless_mode,
+        method=6 if lossless_mode else 2,
+        exact=False,
+    )
+    return buf.getvalue()
+
+
+def _write_files(write_queue, write_failures):
+    """
+    Writer-thread loop: drain (path, data) tuples from write_queue and write
+    them to disk, so disk I/O overlaps with encoding. A None sentinel stops
+    the loop; failed writes are recorded in write_failures.
+    """
+    while True:
+        item = write_queue.get()
+        if item is None:
+            break
+        output_file, data = item
+        try:
+            # Unbuffered: the blob is already complete, so this is a single
+            # write syscall with no copy through Python's buffer layer.
+            with open(output_file, "wb", buffering=0) as f:
+                f.write(data)
+        except OSError as e:
+            write_failures.append(
+                f"Error writing {os.path.basename(output_file)}: {e}"
+            )
+
+
+def _convert_one(
+    image_file, output_file, resize_factor, resample_filter, quality_value, write_queue
+):
+    """
+    Convert a single image file to WebP at output_file.
+
+    The encoded bytes are handed to write_queue (consumed by the writer
+    thread) rather than written here, so the next decode/encode can start
+    while the previous result is still being flushed to disk.
+
+    Module-level (and argument-only) so it can be submitted to an executor.
+    Returns (ok, message) where message is a status/error string.
+    """
+    from PIL import Image, UnidentifiedImageError
+
+    base_name = os.path.basename(image_file)
+    fmt = _EXT_TO_FORMAT.get(os.path.splitext(image_file)[1].lower())
+
+    try:
+        if fmt == "WEBP" and resize_factor == 1.0 and quality_value == 100:
+            # Already WebP, no resize, lossless requested: re-encoding would
+            # only burn CPU (and possibly grow the file), so byte-copy it.
+            shutil.copyfile(image_file, output_file)
+            return True, base_name
+
+        with Image.open(image_file, formats=[fmt] if fmt else None) as img:
+            new_size = None
+            if resize_factor != 1.0:
+                new_size = (
+                    max(1, int(img.width * resize_factor)),
+                    max(1, int(img.height * resize_factor)),
+                )
+                if resize_factor < 1.0:
+                    # For JPEGs this routes to libjpeg's scaled IDCT, decoding
+                    # at 1/2, 1/4 or 1/8 size; a no-op for other formats.
+                    img.draft(None, new_size)
+
+            img_to_save = img
+            # Palette and 1-bit images must leave their index/bilevel modes
+            # before any resampling: interpolating palette indices produces
+            # garbage, and reduce() rejects mode "1" outright.
+            if img.mode == "P":
+                img_to_save = img.convert(
+                    "RGBA" if "transparency" in img.info else "RGB"
+                )
+            elif img.mode == "1":
+                img_to_save = img.convert("RGB")
+
+            # When downscaling, resize before the mode conversion so the
+            # convert touches the small result instead of the full-size
+            # source; when upscaling, convert first so interpolation happens
+            # in the final color space. reducing_gap lets Pillow box-reduce
+            # by an integer factor first and run the expensive convolution
+            # on the smaller intermediate.
+            downscaling = resize_factor < 1.0
+            if (
+                downscaling
+                and new_size is not None
+                and img_to_save.size != new_size
+            ):
+                if img_to_save.size == (new_size[0] * 2, new_size[1] * 2):
+                    # Exact halving: a 2x2 box average is far cheaper than a
+                    # general convolution and visually equivalent here.
+                    img_to_save = img_to_save.reduce(2)
+                else:
+                    img_to_save = img_to_save.resize(
+                        new_size, resample_filter, reducing_gap=3.0
+                    )
+
+            target_mode = _TARGET_MODES.get(img_to_save.mode)
+            if target_mode:
+                img_to_save = img_to_save.convert(target_mode)
+
+            if (
+                not downscaling
+                and new_size is not None
+                and img_to_save.size != new_size
+            ):
+                img_to_save = img_to_save.resize(new_size, resample_filter)
+            if img_to_save is not img:
+                # The convert/resize above produced a new buffer; release the
+                # full-size source now so both are never held across the
+                # encode. Matters most with several pool workers on large
+                # photos, where peak RSS would otherwise double.
+                img.close()
+            lossless_mode = quality_value == 100
+            data = _encode_webp(img_to_save, quality_value, lossless_mode)
+            if img_to_save is not img:
+                # Derived buffer is no longer needed once encoded; close it
+                # here rather than waiting for the garbage collector.
+                img_to_save.close()
+        write_queue.put((output_file, data))
+        return True, base_name
+
+    except FileNotFoundError:
+        return False, f"Error: File not found - {base_name}"
+    except PermissionError:
+        return False, f"Error: Permission denied - {base_name}"
+    except UnidentifiedImageError:
+        return False, f"Error: Cannot identify image - {base_name}"
+    except OSError as e:
+        return False, f"Error processing {base_name}: {e}"
+    except Exception as e:
+        return False, f"Unexpected error processing {base_name}: {e}"
 
 
 class ConversionWorker(QObject):
@@ -32,16 +294,32 @@ class ConversionWorker(QObject):
     finished = pyqtSignal(int, int)
     error = pyqtSignal(str)
 
-    def __init__(self, image_files, size_option, quality_value, output_folder):
+    def __init__(
+        self,
+        image_files,
+        size_option,
+        quality_value,
+        output_folder,
+        force_reconvert=False,
+    ):
         super().__init__()
         self.image_files = image_files
         self.size_option = size_option
         self.quality_value = quality_value
-        self.output_folder = output_folder
-        self._is_running = True
+        self.force_reconvert = force_reconvert
+        # Resolve once so per-image path joins need no further normalization.
+        self.output_folder = os.path.abspath(output_folder)
+        self._stop = threading.Event()
+        self._executor = None
 
     def stop(self):
-        self._is_running = False
+        self._stop.set()
+        # Cancel queued futures immediately rather than waiting for the
+        # consumer loop to notice: only in-flight images then remain, so a
+        # stopped conversion winds down in fractions of a second.
+        executor = self._executor
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
 
     def run_conversion(self):
         if not self.image_files:
@@ -49,88 +327,134 @@ class ConversionWorker(QObject):
             self.finished.emit(0, 0)
             return
 
-        resize_factor = 1.0
-        if self.size_option == "Small":
-            resize_factor = 0.5
-        elif self.size_option == "Medium":
-            resize_factor = 0.75
-        elif self.size_option == "Large":
-            resize_factor = 1.5
-
-        try:
-            resample_filter = Image.Resampling.LANCZOS
-        except AttributeError:
-            resample_filter = Image.LANCZOS
-
-        try:
-            os.makedirs(self.output_folder, exist_ok=True)
-        except OSError as e:
-            self.error.emit(
-                f"Could not create output folder '{self.output_folder}': {e}"
-            )
-            self.finished.emit(0, len(self.image_files))
-            return
-
+        # start_conversion already created the output folder.
         num_images = len(self.image_files)
         success_count = 0
         fail_count = 0
 
-        for i, image_file in enumerate(self.image_files):
-            if not self._is_running:
-                self.status_update.emit("Conversion cancelled.")
-                break
+        # Bounded queue between the encoder pool and the writer thread: disk
+        # writes overlap with encoding, and the bound provides backpressure so
+        # encoded buffers cannot pile up in memory on slow disks.
+        write_queue = queue.Queue(maxsize=4)
+        write_failures = []
+        writer = threading.Thread(
+            target=_write_files, args=(write_queue, write_failures), daemon=True
+        )
+        writer.start()
+
+        # Resolve per-batch constants once instead of per image.
+        resize_factor = _RESIZE_FACTORS.get(self.size_option, 1.0)
+        quality_value = self.quality_value
+        resample_filter = _resample_filter(quality_value)
+        output_folder = self.output_folder
+
+        # Derive all (source, output) path pairs up front, then skip pairs
+        # whose output already exists and is newer than the source:
+        # re-running the same batch only pays for new/changed files. The
+        # mtime check cannot see changed quality/size settings, so the
+        # force_reconvert flag (wired to a checkbox) bypasses it.
+        tasks = [
+            (
+                image_file,
+                os.path.join(
+                    output_folder,
+                    f"{os.path.splitext(os.path.basename(image_file))[0]}.webp",
+                ),
+            )
+            for image_file in self.image_files
+        ]
+
+        to_convert = []
+        for image_file, output_file in tasks:
+            if not self.force_reconvert:
+                try:
+                    if os.stat(output_file).st_mtime >= os.stat(image_file).st_mtime:
+                        success_count += 1
+                        continue
+                except OSError:
+                    pass
+            to_convert.append((image_file, output_file))
+
+        skipped = success_count
+        if skipped:
+            self.status_update.emit(
+                f"Skipped {skipped} already converted image(s)."
+            )
+            self.progress.emit(int((skipped / num_images) * 100))
 
-            progress_percent = int((i / num_images) * 100)
-            self.progress.emit(progress_percent)
-            base_name = os.path.basename(image_file)
-            self.status_update.emit(f"Processing ({i+1}/{num_images}): {base_name}")
+        executor = self._executor = ThreadPoolExecutor(
+            max_workers=max(1, min(os.cpu_count() or 1, len(to_convert)))
+        )
+        futures = {
+            executor.submit(
+                _convert_one,
+                image_file,
+                output_file,
+                resize_factor,
+                resample_filter,
+                quality_value,
+                write_queue,
+            ): image_file
+            for image_file, output_file in to_convert
+        }
 
-            output_filename = f"{os.path.splitext(base_name)[0]}.webp"
-            output_file = os.path.join(self.output_folder, output_filename)
+        # Each emit is a queued cross-thread slot call; on batches of
+        # thousands of small images, per-image emission floods the GUI event
+        # loop. Gate routine updates to ~30 Hz (faster than anyone can read,
+        # far slower than tiny-image completion rates); errors and the final
+        # image always get through.
+        last_pct = -1
+        last_emit = 0.0
 
-            try:
-                with Image.open(image_file) as img:
-                    img_to_save = img
-                    if img.mode in ("P", "L", "LA") and self.quality_value < 100:
-                        img_to_save = img.convert("RGBA")
-                    elif img.mode == "CMYK":
-                        img_to_save = img.convert("RGB")
-                    if resize_factor != 1.0:
-                        new_size = (
-                            int(img.width * resize_factor),
-                            int(img.height * resize_factor),
+        try:
+            for done, future in enumerate(as_completed(futures), start=1):
+                # Checked on every completion so stop() is honored before
+                # the next result is consumed; stop() has already cancelled
+                # whatever was still queued.
+                if self._stop.is_set():
+                    self.status_update.emit("Conversion cancelled.")
+                    break
+
+                ok, message = future.result()
+                is_last = done == len(futures)
+                now = time.monotonic()
+                may_emit = is_last or now - last_emit > 0.033
+
+                if ok:
+                    success_count += 1
+                    if may_emit:
+                        self.status_update.emit(
+                            f"Processed ({skipped + done}/{num_images}): {message}"
                         )
-                        new_size = (max(1, new_size[0]), max(1, new_size[1]))
-                        img_to_save = img_to_save.resize(new_size, resample_filter)
-                    lossless_mode = self.quality_value == 100
-                    img_to_save.save(
-                        output_file,
-                        "WEBP",
-                        quality=self.quality_value,
-                        lossless=lossless_mode,
-                    )
-
-                success_count += 1
-
-            except FileNotFoundError:
-                self.status_update.emit(f"Error: File not found - {base_name}")
-                fail_count += 1
-            except PermissionError:
-                self.status_update.emit(f"Error: Permission denied - {base_name}")
-                fail_count += 1
-            except UnidentifiedImageError:
-                self.status_update.emit(f"Error: Cannot identify image - {base_name}")
-                fail_count += 1
-            except OSError as e:
-                self.status_update.emit(f"Error processing {base_name}: {e}")
-                fail_count += 1
-            except Exception as e:
-                self.status_update.emit(f"Unexpected error processing {base_name}: {e}")
-                fail_count += 1
-
-            QApplication.processEvents()
-
-        if self._is_running:
+                else:
+                    fail_count += 1
+                    self.status_update.emit(message)
+
+                pct = int(((skipped + done) / num_images) * 100)
+                if may_emit:
+                    if pct != last_pct:
+                        self.progress.emit(pct)
+                        last_pct = pct
+                    last_emit = now
+
+                # Periodic collection returns any cycle-trapped pixel buffers
+                # to the allocator before they accumulate across a big batch.
+                if done % 32 == 0:
+                    gc.collect()
+        finally:
+            # Wait for in-flight encodes before stopping the writer, so no
+            # worker is left blocked on a put() into an unconsumed queue.
+            executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+            write_queue.put(None)
+            writer.join()
+
+        for failure in write_failures:
+            success_count -= 1
+            fail_count += 1
+            self.status_update.emit(failure)
+
+        if not self._stop.is_set():
             self.progress.emit(100)
         self.finished.emit(success_count, fail_count)
 
@@ -141,8 +465,11 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("Image Converter")
         self.setGeometry(100, 100, 600, 400)
         self.base_dir = os.path.dirname(os.path.abspath(__file__))
-        self.image_files = []
+        # Insertion-ordered dict used as a set: O(1) dedup per added file,
+        # display order preserved. Values are unused.
+        self.image_files = {}
         self.output_folder = os.path.join(os.path.expanduser("~"), "converted_webp")
+        self._output_folder_abs = os.path.abspath(self.output_folder)
         self.conversion_thread = None
         self.conversion_worker = None
         icon_path = os.path.join(self.base_dir, "icon.ico")
@@ -151,6 +478,11 @@ class MainWindow(QMainWindow):
         else:
             print(f"Warning: Icon file not found at '{icon_path}'")
 
+        # Deferred to the event loop: importing PIL here would load its C
+        # extensions before the window ever paints, defeating the lazy
+        # import in the conversion helpers.
+        QTimer.singleShot(0, self._report_imaging_backends)
+
         central_widget = QWidget(self)
         self.setCentralWidget(central_widget)
         layout = QVBoxLayout(central_widget)
@@ -179,7 +511,7 @@ class MainWindow(QMainWindow):
         output_layout.addWidget(self.select_output_button)
 
         self.output_path_display = QLineEdit(self)
-        self.output_path_display.setText(os.path.abspath(self.output_folder))
+        self.output_path_display.setText(self._output_folder_abs)
         self.output_path_display.setReadOnly(True)
         output_layout.addWidget(self.output_path_display)
         layout.addLayout(output_layout)
@@ -210,6 +542,16 @@ class MainWindow(QMainWindow):
         quality_layout.addWidget(self.quality_value_label)
         layout.addLayout(quality_layout)
 
+        self.force_reconvert_checkbox = QCheckBox(
+            "Re-convert files whose output already exists", self
+        )
+        self.force_reconvert_checkbox.setToolTip(
+            "When unchecked, images whose .webp output is newer than the "
+            "source are skipped. Check this after changing the size or "
+            "quality settings to regenerate existing outputs."
+        )
+        layout.addWidget(self.force_reconvert_checkbox)
+
         self.convert_button = QPushButton("Convert to WebP", self)
         self.convert_button.setEnabled(False)
         layout.addWidget(self.convert_button)
@@ -229,13 +571,29 @@ class MainWindow(QMainWindow):
 
         self.update_ui_after_selection()
 
+    def _report_imaging_backends(self):
+        """Prints Pillow build diagnostics once the event loop is running."""
+        try:
+            from PIL import __version__ as pil_version, features
+
+            # Pillow-SIMD versions itself as e.g. "9.0.0.post1".
+            if ".post" in pil_version:
+                print(f"Pillow-SIMD build detected ({pil_version}).")
+            if not features.check_feature("libjpeg_turbo"):
+                print(
+                    "Warning: Pillow is not built against libjpeg-turbo; "
+                    "JPEG decoding will be noticeably slower."
+                )
+        except Exception:
+            # Older Pillow builds don't know this feature flag; not worth
+            # failing startup over a diagnostic.
+            pass
+
     def dragEnterEvent(self, event):
         mime_data = event.mimeData()
         if mime_data.hasUrls() and all(url.isLocalFile() for url in mime_data.urls()):
             if any(
-                url.toLocalFile()
-                .lower()
-                .endswith((".png", ".webp", ".jpg", ".jpeg", ".bmp", ".gif", ".tiff"))
+                os.path.splitext(url.toLocalFile())[1].lower() in VALID_EXTS
                 for url in mime_data.urls()
             ):
                 event.acceptProposedAction()
@@ -245,15 +603,11 @@ class MainWindow(QMainWindow):
         for url in event.mimeData().urls():
             if url.isLocalFile():
                 file_path = url.toLocalFile()
-                if file_path.lower().endswith(
-                    (".png", ".webp", ".jpg", ".jpeg", ".bmp", ".gif", ".tiff")
-                ):
+                if os.path.splitext(file_path)[1].lower() in VALID_EXTS:
                     valid_files.append(file_path)
 
         if valid_files:
-            self.image_files.extend(valid_files)
-            self.image_files = sorted(list(set(self.image_files)))
-            self.update_ui_after_selection()
+            self._add_files(valid_files)
         else:
             self.status_label.setText("Drop contained no supported image files.")
             event.ignore()
@@ -269,9 +623,14 @@ class MainWindow(QMainWindow):
             filter_string,
         )
         if files:
-            self.image_files.extend(files)
-            self.image_files = sorted(list(set(self.image_files)))
-            self.update_ui_after_selection()
+            # Yield to the event loop first so the native dialog closes
+            # immediately even when thousands of files were selected.
+            QTimer.singleShot(0, lambda: self._add_files(files))
+
+    def _add_files(self, files):
+        """Merges new file paths into the selection and refreshes the UI."""
+        self.image_files.update(dict.fromkeys(files))
+        self.update_ui_after_selection()
 
     def clear_selection(self):
         """Clears the list of selected image files."""
@@ -287,13 +646,14 @@ class MainWindow(QMainWindow):
         )
         if directory:
             self.output_folder = directory
+            self._output_folder_abs = os.path.abspath(directory)
             self.output_path_display.setText(self.output_folder)
             self.update_ui_after_selection()
             self.status_label.setText(f"Output folder set to: {self.output_folder}")
 
     def update_ui_after_selection(self):
         """Updates UI elements after files are selected, cleared, or output folder changes."""
-        current_output_path = os.path.abspath(self.output_folder)
+        current_output_path = self._output_folder_abs
         self.output_path_display.setText(current_output_path)
 
         if self.image_files:
@@ -355,6 +715,7 @@ class MainWindow(QMainWindow):
             size_option=size_option,
             quality_value=quality_value,
             output_folder=self.output_folder,
+            force_reconvert=self.force_reconvert_checkbox.isChecked(),
         )
         self.conversion_worker.moveToThread(self.conversion_thread)
 
@@ -383,6 +744,7 @@ class MainWindow(QMainWindow):
         self.convert_button.setEnabled(enabled and bool(self.image_files))
         self.size_combo.setEnabled(enabled)
         self.quality_slider.setEnabled(enabled)
+        self.force_reconvert_checkbox.setEnabled(enabled)
         self.setAcceptDrops(enabled)
 
     def update_progress(self, value):
@@ -399,7 +761,7 @@ class MainWindow(QMainWindow):
 
     def conversion_finished(self, success_count, fail_count):
 
-        final_output_path = os.path.abspath(self.output_folder)
+        final_output_path = self._output_folder_abs
         self.status_label.setText(
             f"Conversion complete: {success_count} succeeded, {fail_count} failed."
         )
@@ -428,9 +790,13 @@ class MainWindow(QMainWindow):
                 if self.conversion_worker:
                     self.conversion_worker.stop()
                 self.conversion_thread.quit()
-                if not self.conversion_thread.wait(1000):
-                    print("Warning: Thread termination timeout.")
-                    self.conversion_thread.terminate()
+                # stop() already cancelled the queued futures, so only
+                # in-flight images remain; wait for the graceful exit.
+                # terminate() would skip the cleanup that stops the pool,
+                # whose non-daemon threads would then keep converting the
+                # whole batch invisibly after the window closed.
+                if not self.conversion_thread.wait(10000):
+                    print("Warning: Conversion thread did not stop in time.")
                 event.accept()
             else:
                 event.ignore()